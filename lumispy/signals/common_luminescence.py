@@ -34,6 +34,13 @@ from lumispy.utils import (
     var2invcm,
 )
 
+# Default values of the variance linear model parameters
+_VARIANCE_LINEAR_MODEL_DEFAULTS = (
+    ("gain_factor", 1),
+    ("gain_offset", 0),
+    ("correlation_factor", 1),
+)
+
 
 class CommonLumi:
     """**General luminescence signal class (dimensionless)**"""
@@ -229,34 +236,17 @@ class CommonLumi:
         """Resets the variance linear model parameters to their default values,
         as they are not applicable any longer after a Jacobian transformation.
         """
-        if (
-            (
-                self.metadata.has_item(
-                    "Signal.Noise_properties.Variance_linear_model.gain_factor"
-                )
-                and self.metadata.Signal.Noise_properties.Variance_linear_model.gain_factor
-                != 1
-            )
-            or (
-                self.metadata.has_item(
-                    "Signal.Noise_properties.Variance_linear_model.gain_offset"
-                )
-                and self.metadata.Signal.Noise_properties.Variance_linear_model.gain_offset
-                != 0
-            )
-            or (
-                self.metadata.has_item(
-                    "Signal.Noise_properties.Variance_linear_model.correlation_factor"
-                )
-                and self.metadata.Signal.Noise_properties.Variance_linear_model.correlation_factor
-                != 1
-            )
+        path = "Signal.Noise_properties.Variance_linear_model"
+        if not self.metadata.has_item(path):
+            return
+        # the node is looked up once, missing parameters count as default
+        vlm = self.metadata.get_item(path)
+        if any(
+            vlm.get_item(name, default) != default
+            for name, default in _VARIANCE_LINEAR_MODEL_DEFAULTS
         ):
-            self.metadata.Signal.Noise_properties.Variance_linear_model.gain_factor = 1
-            self.metadata.Signal.Noise_properties.Variance_linear_model.gain_offset = 0
-            self.metadata.Signal.Noise_properties.Variance_linear_model.correlation_factor = (
-                1
-            )
+            for name, default in _VARIANCE_LINEAR_MODEL_DEFAULTS:
+                vlm.set_item(name, default)
             warn(
                 "Following the Jacobian transformation, the parameters of the "
                 "`Variance_linear_model` are reset to their default values "
@@ -264,22 +254,67 @@ class CommonLumi:
                 UserWarning,
             )
 
-    def _convert_data(self, newaxis, factor, inplace, jacobian, data2, var2):
+    def _signal_axis_index(self):
+        """Returns the index of the (first) signal axis as to be passed to
+        `axes_manager.set_axis` when replacing it.
+        """
+        axind = self.axes_manager.signal_axes[0].index_in_axes_manager
+        # workaround for bug in set_axis that changes wrong axis
+        if self.axes_manager.signal_dimension == 2:
+            axind += 1
+        return axind
+
+    def _convert_data(
+        self,
+        newaxis,
+        factor,
+        inplace,
+        jacobian,
+        data2,
+        var2,
+        out=None,
+        jacobian_axis=None,
+        reverse=True,
+    ):
         """Utility function to perform the data and variance conversion for
-        signal unit transformations.
+        signal unit transformations. By default, the direction of the signal
+        axis is inverted and the Jacobian is computed on the new axis.
+        Otherwise, `jacobian_axis` gives the axis values for the Jacobian.
+        `reverse=False` (keeping the direction of the signal axis) is only
+        supported for the wavenumber conversion (`data2invcm`), as `data2eV`
+        always evaluates the refractive index on the reversed original axis.
         """
-        # convert data
+        if out is not None and self._lazy:
+            raise ValueError("The `out` parameter is not supported for lazy signals.")
+        if not reverse and data2 is data2eV:
+            raise ValueError(
+                "`reverse=False` is not supported for the conversion to energy."
+            )
+        oldaxis = self.axes_manager.signal_axes[0]
+        if jacobian_axis is None:
+            jacobian_axis = newaxis.axis
+        # the signal axis is reversed with a view of the data instead of
+        # slicing the whole signal
+        flip = np.s_[..., ::-1] if reverse else np.s_[...]
+        # convert data (the Jacobian transformation returns a new array, which
+        # keeps dask arrays of lazy signals lazy)
         if jacobian:
-            s2data = np.copy(
-                data2(
-                    self.isig[::-1].data,
-                    factor,
-                    newaxis.axis,
-                    self.axes_manager.signal_axes[0],
-                )
+            s2data = data2(
+                self.data[flip],
+                factor,
+                jacobian_axis,
+                oldaxis,
+                out=out,
             )
+        elif out is not None:
+            np.copyto(out, self.data[flip])
+            s2data = out
         else:
-            s2data = np.copy(self.isig[::-1].data)
+            # the view is sufficient when the data is replaced in place, a new
+            # signal needs its own copy of the data
+            s2data = self.data[flip]
+            if not inplace:
+                s2data = s2data.copy()
 
         # inplace conversion
         if inplace:
@@ -293,28 +328,23 @@ class CommonLumi:
                 copy_learning_results=False,
             )
         # convert axis
-        oldaxis = self.axes_manager.signal_axes[0]
-        axind = self.axes_manager.signal_axes[0].index_in_axes_manager
-        # workaround for bug in set_axis that changes wrong axis
-        if self.axes_manager.signal_dimension == 2:
-            axind += 1
-        s2.axes_manager.set_axis(newaxis, axind)
+        s2.axes_manager.set_axis(newaxis, self._signal_axis_index())
         # convert variance
         if self.metadata.has_item("Signal.Noise_properties.variance"):
             var = self.get_noise_variance()
             if jacobian:
-                # if variance is a numeric value, cast into signal object
+                # a numeric variance is constant along the signal axis, it is
+                # neither reversed nor cast into a (metadata copying) signal;
+                # the broadcast view is only materialized by the Jacobian
                 if isinstance(var, (float, int)):
-                    var = self._deepcopy_with_new_data(
-                        np.ones(self.data.shape) * var,
-                        copy_variance=False,
-                        copy_learning_results=False,
-                    )
+                    vardata = np.broadcast_to(np.float64(var), self.data.shape)
+                else:
+                    vardata = var.data[flip]
                 s2var = s2._deepcopy_with_new_data(
                     var2(
-                        var.isig[::-1].data,
+                        vardata,
                         factor,
-                        newaxis.axis,
+                        jacobian_axis,
                         oldaxis,
                     ),
                     copy_variance=False,
@@ -326,11 +356,11 @@ class CommonLumi:
                 # variance left unchanged, if it is a number and Jacobian not performed
                 if isinstance(var, (float, int)):
                     if not inplace:
-                        s2.set_noise_variance(self.get_noise_variance())
+                        s2.set_noise_variance(var)
                 else:
                     s2.set_noise_variance(
                         s2._deepcopy_with_new_data(
-                            var.isig[::-1].data,
+                            var.data[flip],
                             copy_variance=False,
                             copy_learning_results=False,
                         )
@@ -340,7 +370,7 @@ class CommonLumi:
         else:
             return None
 
-    def to_eV(self, inplace=True, jacobian=True):
+    def to_eV(self, inplace=True, jacobian=True, out=None):
         """Converts signal axis of 1D signal to non-linear energy axis (eV)
         using wavelength dependent refractive index of air. Assumes wavelength
         in units of nm unless the axis units are specifically set to µm.
@@ -353,7 +383,9 @@ class CommonLumi:
         `metadata.Signal.Noise_properties.variance` is a signal representing
         the variance, a squared renormalization of the variance is performed.
         Note that if the variance is a number (not a signal instance), it is
-        converted to a signal if the Jacobian transformation is performed
+        converted to a signal if the Jacobian transformation is performed.
+        The transformed data keeps the precision of floating point data (e.g.
+        float32), while integer data is converted to float64.
 
         Parameters
         ----------
@@ -364,6 +396,12 @@ class CommonLumi:
             The default is to do the Jacobian transformation (recommended at
             least for luminescence signals), but the transformation can be
             suppressed by setting this option to `False`.
+        out : numpy.ndarray or None
+            Preallocated array with the shape of the data (and a floating point
+            type if the Jacobian transformation is performed) into which the
+            converted data is written. Reusing one buffer avoids repeated
+            allocations when converting many signals. The default `None`
+            allocates a new array. Not supported for lazy signals.
 
         Examples
         --------
@@ -375,7 +413,9 @@ class CommonLumi:
 
         evaxis, factor = axis2eV(self.axes_manager.signal_axes[0])
 
-        return self._convert_data(evaxis, factor, inplace, jacobian, data2eV, var2eV)
+        return self._convert_data(
+            evaxis, factor, inplace, jacobian, data2eV, var2eV, out=out
+        )
 
     TO_INVCM_DOCSTRING = """
         The intensity is converted from counts/nm (counts/µm) to counts/cm^-1
@@ -386,7 +426,9 @@ class CommonLumi:
         `metadata.Signal.Noise_properties.variance` is a signal representing the
         variance, a squared renormalization of the variance is performed.
         Note that if the variance is a number (not a signal instance), it is
-        converted to a signal if the Jacobian transformation is performed
+        converted to a signal if the Jacobian transformation is performed.
+        The transformed data keeps the precision of floating point data (e.g.
+        float32), while integer data is converted to float64.
 
         Parameters
         ----------
@@ -404,7 +446,7 @@ class CommonLumi:
         >>> S1.to_invcm()
         """
 
-    def to_invcm(self, inplace=True, jacobian=True):
+    def to_invcm(self, inplace=True, jacobian=True, out=None):
         """Converts signal axis of 1D signal to non-linear wavenumber axis
         (cm^-1). Assumes wavelength in units of nm unless the axis units are
         specifically set to µm.
@@ -413,13 +455,19 @@ class CommonLumi:
             The default is to do the Jacobian transformation (recommended at
             least for luminescence signals), but the transformation can be
             suppressed by setting this option to `False`.
+        out : numpy.ndarray or None
+            Preallocated array with the shape of the data (and a floating point
+            type if the Jacobian transformation is performed) into which the
+            converted data is written. Reusing one buffer avoids repeated
+            allocations when converting many signals. The default `None`
+            allocates a new array. Not supported for lazy signals.
         %s
         """
 
         invcmaxis, factor = axis2invcm(self.axes_manager.signal_axes[0])
 
         return self._convert_data(
-            invcmaxis, factor, inplace, jacobian, data2invcm, var2invcm
+            invcmaxis, factor, inplace, jacobian, data2invcm, var2invcm, out=out
         )
 
     to_invcm.__doc__ %= (TO_INVCM_DOCSTRING, TO_INVCM_EXAMPLE)
@@ -461,58 +509,38 @@ class CommonLumi:
                 laser = self.metadata.get_item(
                     "Acquisition_instrument.Laser.wavelength"
                 )
+        sigaxis = self.axes_manager.signal_axes[0]
         # check if laser units make sense in respect to signal units
-        if (self.axes_manager.signal_axes[0].units == "µm" and laser > 10) or (
-            self.axes_manager.signal_axes[0].units == "nm" and laser < 100
+        if (sigaxis.units == "µm" and laser > 10) or (
+            sigaxis.units == "nm" and laser < 100
         ):
             raise AttributeError(
                 "Laser wavelength units do not seem to match the signal units."
             )
 
-        invcmaxis, factor = axis2invcm(self.axes_manager.signal_axes[0])
-
-        # convert to relative wavenumber scale
-        if self.axes_manager.signal_axes[0].units == "µm":
+        if sigaxis.units == "µm":
             invcmlaser = nm2invcm(1000 * laser)
         else:
             invcmlaser = nm2invcm(laser)
+
+        # the absolute wavenumbers in the original order of the signal axis
+        # are used for the Jacobian, the relative scale has the same direction
+        # as the original axis, i.e. the data is not reversed
+        invcmaxis, factor = axis2invcm(sigaxis)
         absaxis = invcmaxis.axis[::-1]
         invcmaxis.axis = invcmlaser - absaxis
         invcmaxis.name = "Raman Shift"
 
-        # replace signal axis after conversion
-        # conversion (using absolute scale for Jacobian)
-        if inplace:
-            self.to_invcm(inplace=inplace, jacobian=jacobian)
-            s2 = self
-        else:
-            s2 = self.to_invcm(inplace=inplace, jacobian=jacobian)
-        # replace axis
-        axind = self.axes_manager.signal_axes[0].index_in_axes_manager
-        # workaround for bug in set_axis that changes wrong axis
-        if self.axes_manager.signal_dimension == 2:
-            axind += 1
-        s2.axes_manager.set_axis(invcmaxis, axind)
-        s2.data = s2.isig[::-1].data
-        # replace variance axis
-        if s2.metadata.has_item("Signal.Noise_properties.variance") and not isinstance(
-            s2.get_noise_variance(), (float, int)
-        ):
-            axind = self.axes_manager.signal_axes[0].index_in_axes_manager
-            # workaround for bug in set_axis that changes wrong axis
-            if self.axes_manager.signal_dimension == 2:
-                axind += 1
-            s2.metadata.Signal.Noise_properties.variance.axes_manager.set_axis(
-                invcmaxis,
-                axind,
-            )
-            s2.metadata.Signal.Noise_properties.variance.data = (
-                s2.metadata.Signal.Noise_properties.variance.isig[::-1].data
-            )
-        if not inplace:
-            return s2
-        else:
-            return None
+        return self._convert_data(
+            invcmaxis,
+            factor,
+            inplace,
+            jacobian,
+            data2invcm,
+            var2invcm,
+            jacobian_axis=absaxis,
+            reverse=False,
+        )
 
     to_invcm_relative.__doc__ %= (
         TO_INVCM_DOCSTRING,
@@ -23,13 +23,14 @@ from warnings import warn
 
 from hyperspy.signals import Signal1D
 from hyperspy._signals.lazy import LazySignal
+from hyperspy.misc.utils import add_scalar_axis
 from traits.api import Undefined
 
 from lumispy.signals.common_luminescence import CommonLumi
 from lumispy import to_array, savetxt
 from lumispy.utils import solve_grating_equation
-from lumispy.utils.axes import GRATING_EQUATION_DOCSTRING_PARAMETERS
-from lumispy.utils.signals import com
+from lumispy.utils.axes import GRATING_EQUATION_DOCSTRING_PARAMETERS, _float_dtype
+from lumispy.utils.signals import _com_batch
 from lumispy.utils.io import (
     SAVETXT_DOCSTRING,
     SAVETXT_PARAMETERS,
@@ -59,7 +60,10 @@ class LumiSpectrum(Signal1D, CommonLumi):
             [[xs],[ys]] or a Signal1D object. If the x-axis values do not match
             the signal_axes, then interpolation is done before subtraction. If
             only the intensity values are provided, [ys], the functions assumes
-            no interpolation needed.
+            no interpolation needed. When the same background is subtracted
+            from many signals sharing one signal axis, interpolate it once,
+            e.g. `ys = np.interp(s.axes_manager.signal_axes[0].axis, xs, ys)`,
+            and pass [ys] to avoid repeating the interpolation for each call.
         inplace : boolean
             If False, it returns a new object with the transformation. If True,
             the original object is transformed, returning no object.
@@ -71,7 +75,9 @@ class LumiSpectrum(Signal1D, CommonLumi):
 
         Notes
         -----
-        This function does not work with non-uniform axes.
+        This function does not work with non-uniform axes. The subtracted
+        data keeps the precision of floating point data (e.g. float32), while
+        integer data is converted to float64.
         """
         warn(
             "The use of `remove_background_from_file` is deprecated and will "
@@ -102,39 +108,48 @@ class LumiSpectrum(Signal1D, CommonLumi):
                 y = background.data
                 background = [x, y]
 
-            background_xy = background
+            # Dispatch on the number of rows, ragged [xs, ys] lists are never
+            # promoted to a (object) array
+            nrows = len(background)
 
-            if np.shape(background_xy)[0] == 1:
+            if nrows == 1:
                 bkg_x = signal_x
-                bkg_y = background_xy[0]
-            elif np.shape(background_xy)[0] == 2:
-                try:
-                    bkg_x = background_xy[0]
-                    bkg_y = background_xy[1]
-                except IndexError:  # pragma: no cover
+                bkg_y = background[0]
+                if len(bkg_y) != len(bkg_x):
                     raise AttributeError(
-                        "Please provide a background file containing both the x and y axis."
+                        "The background needs to have the length of the signal axis."
+                    )
+            elif nrows == 2:
+                bkg_x, bkg_y = background
+                if len(bkg_x) != len(bkg_y):
+                    raise AttributeError(
+                        "The x and y axis of the background need to be of the same "
+                        "length."
                     )
             else:
                 raise AttributeError(
                     "Please, provide a background of shape (2, n) or (n,)"
                 )
 
-            if not np.array_equal(bkg_x, signal_x):
-                # Interpolation needed
+            # Interpolation needed (np.array_equal compares the shapes before
+            # the values, an intensity-only background uses the signal axis)
+            if bkg_x is not signal_x and not np.array_equal(bkg_x, signal_x):
                 bkg_y = np.interp(signal_x, bkg_x, bkg_y)
+            # Match floating point data (e.g. float32), so the subtraction
+            # does not upcast the whole data array
+            bkg_y = np.asarray(bkg_y, dtype=_float_dtype(self.data))
 
+            # The background broadcasts along all navigation axes, so the
+            # subtraction is done in a single pass over the data
             if not inplace:
-                self_subtracted = self.map(
-                    lambda s, bkg: s - bkg, bkg=bkg_y, inplace=False
-                )
+                self_subtracted = self._deepcopy_with_new_data(self.data - bkg_y)
                 self_subtracted.metadata.set_item("Signal.background_subtracted", True)
                 self_subtracted.metadata.set_item("Signal.background", bkg_y)
                 return self_subtracted
             else:
                 self.metadata.set_item("Signal.background_subtracted", True)
                 self.metadata.set_item("Signal.background", bkg_y)
-                return self.map(lambda s, bkg: s - bkg, bkg=bkg_y, inplace=True)
+                self.data = self.data - bkg_y
 
     SAVETXT_EXAMPLE = """
     Examples
@@ -339,7 +354,15 @@ class LumiSpectrum(Signal1D, CommonLumi):
             s = self
 
         signal_axis = s.axes_manager.signal_axes[0]
-        center_of_mass = s.map(com, signal_axis=signal_axis, inplace=False)
+        # All spectra are processed at once instead of mapping `com` over the
+        # navigation axes, the result has the navigation axes of the signal
+        center_of_mass = s._deepcopy_with_new_data(_com_batch(s.data, signal_axis))
+        am = center_of_mass.axes_manager
+        am.remove(am.signal_axes)
+        if am.navigation_dimension == 0:
+            add_scalar_axis(center_of_mass)
+        center_of_mass.get_dimensions_from_data()
+        center_of_mass._assign_subclass()
 
         # Transfer axes metadata to title
         center_of_mass.metadata.General.title = f"Centroid map"
@@ -21,7 +21,7 @@ Signal class for luminescence transient data (2D)
 -------------------------------------------------
 """
 
-import pint
+from functools import lru_cache
 
 from hyperspy.signals import Signal1D, Signal2D
 from hyperspy._signals.lazy import LazySignal
@@ -32,6 +32,23 @@ from lumispy.signals.common_luminescence import CommonLumi
 from lumispy.signals.common_transient import CommonTransient
 
 
+@lru_cache(maxsize=None)
+def _unit_registry():
+    """Returns the pint unit registry, which is only created once, as its
+    construction parses the complete unit definitions.
+    """
+    import pint
+
+    return pint.UnitRegistry()
+
+
+@lru_cache(maxsize=None)
+def _is_time_unit(units):
+    """Checks whether `units` has the dimensionality of time."""
+    ureg = _unit_registry()
+    return ureg(units).dimensionality == ureg("s").dimensionality
+
+
 class TransientSpectrumCasting(Signal1D, CommonLumi, CommonTransient):
     """**Hidden signal class**
     1D version of ``TransientSpectrum`` signal class for casting
@@ -53,11 +70,8 @@ class TransientSpectrumCasting(Signal1D, CommonLumi, CommonTransient):
     _signal_dimension = 1
 
     def __init__(self, *args, **kwargs):
-        ureg = pint.UnitRegistry()
-        if (
-            hasattr(self, "axes_manager")
-            and ureg(self.axes_manager.signal_axes[-1].units).dimensionality
-            == ureg("s").dimensionality
+        if hasattr(self, "axes_manager") and _is_time_unit(
+            self.axes_manager.signal_axes[-1].units
         ):
             self.set_signal_type("Transient")
         else:
@@ -32,12 +32,10 @@ class TestCLSEMSpectrum:
         calx, corg, fov = 1e-10, 1e-10, 1e-10
         s = CLSEMSpectrum(np.random.random(nx * ny * 100).reshape(ny, nx, 100))
 
-        garray = np.arange(
-            (-corg / 2) * calx / (fov * nx) * 1000 * nx,
-            (corg / 2) * calx / (fov * nx) * 1000 * nx,
-            corg * calx / (fov * nx) * 1000,
-        )
-        barray = np.full((ny, nx), garray)
+        # exactly nx shifts, a float np.arange could add a spurious element
+        step = corg * calx / (fov * nx) * 1000
+        garray = np.linspace(-nx / 2, nx / 2 - 1, nx) * step
+        barray = np.broadcast_to(garray, (ny, nx))
 
         s2 = s.deepcopy()
         s.correct_grating_shift(calx, corg, fov)
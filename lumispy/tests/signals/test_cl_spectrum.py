@@ -49,9 +49,9 @@ class TestCLSpectrum:
     def test_remove_spikes(self):
         s = CLSpectrum(np.ones((2, 3, 30)))
         s.add_gaussian_noise(1e-5)
-        # Add three spikes
-        s.data[1, 0, 1] += 2
-        s.data[0, 2, 29] += 1.001
+        # Add two spikes
+        spikes = (np.array([1, 0]), np.array([0, 2]), np.array([1, 29]))
+        s.data[spikes] += np.array([2, 1.001])
 
         if not "threshold" in getfullargspec(s.spikes_removal_tool)[0]:
             try:
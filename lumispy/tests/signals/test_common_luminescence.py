@@ -22,10 +22,44 @@ import pytest
 from lumispy.signals import LumiSpectrum, LumiTransientSpectrum
 
 
+@pytest.fixture(scope="module")
+def ones_3d():
+    data = np.ones((10, 10, 10))
+    data.flags.writeable = False
+    return data
+
+
+@pytest.fixture(scope="module")
+def ones_4d():
+    data = np.ones((10, 10, 10, 10))
+    data.flags.writeable = False
+    return data
+
+
+@pytest.fixture(scope="module")
+def rng():
+    return np.random.default_rng(0)
+
+
+@pytest.fixture(scope="module")
+def random_3d(rng):
+    data = rng.random((10, 10, 10))
+    data.flags.writeable = False
+    return data
+
+
+@pytest.fixture(scope="module")
+def random_4d(rng):
+    data = rng.random((10, 10, 10, 10))
+    data.flags.writeable = False
+    return data
+
+
 class TestCommonLumi:
-    def test_crop_edges(self):
-        s1 = LumiSpectrum(np.ones((10, 10, 10)))
-        s2 = LumiTransientSpectrum(np.ones((10, 10, 10, 10)))
+    def test_crop_edges(self, ones_3d, ones_4d):
+        # crop_edges does not modify the data, so the arrays can be shared
+        s1 = LumiSpectrum(ones_3d)
+        s2 = LumiTransientSpectrum(ones_4d)
         s3 = LumiSpectrum(np.ones((3, 3, 10)))
         s1 = s1.crop_edges(crop_px=2)
         s2 = s2.crop_edges(crop_px=2)
@@ -36,17 +70,17 @@ class TestCommonLumi:
         with pytest.raises(ValueError):
             s3.crop_edges(crop_px=2)
 
-    def test_remove_negative(self):
-        s1 = LumiSpectrum(np.random.random((10, 10, 10))) - 0.3
-        s2 = LumiTransientSpectrum(np.random.random((10, 10, 10, 10))) - 0.3
-        s3 = LumiTransientSpectrum(np.random.random((10, 10, 10, 10))) - 0.3
+    def test_remove_negative(self, random_3d, random_4d):
+        s1 = LumiSpectrum(random_3d - 0.3)
+        s2 = LumiTransientSpectrum(random_4d - 0.3)
+        s3 = LumiTransientSpectrum(random_4d - 0.3)
         s1a = s1.remove_negative(inplace=False)
         s2a = s2.remove_negative(inplace=False)
         s3a = s3.remove_negative(basevalue=0.1)
         assert s3a.metadata.Signal.negative_removed == True
-        assert np.all(s1a.data[s1 <= 0] == 1)
-        assert np.all(s2a.data[s2 <= 0] == 1)
-        assert np.all(s3a.data[s3 <= 0] == 0.1)
+        assert np.array_equal(s1a.data, np.where(s1.data < 0, 1, s1.data))
+        assert np.array_equal(s2a.data, np.where(s2.data < 0, 1, s2.data))
+        assert np.array_equal(s3a.data, np.where(s3.data < 0, 0.1, s3.data))
         s1.remove_negative(inplace=True)
         s2.remove_negative(inplace=True)
         s3.remove_negative(basevalue=0.1, inplace=True)
@@ -97,32 +131,33 @@ class TestCommonLumi:
             s6.scale_by_exposure(inplace=True, exposure=0.5)
             assert np.all(s6.data == 2)
 
-    def test_normalize(self):
-        s1 = LumiSpectrum(np.random.random((10, 10, 10))) * 2
-        s2 = LumiTransientSpectrum(np.random.random((10, 10, 10, 10))) * 2
+    def test_normalize(self, random_3d, random_4d):
+        s1 = LumiSpectrum(random_3d * 2)
+        s2 = LumiTransientSpectrum(random_4d * 2)
         s2.axes_manager.signal_axes[-1].units = "ps"
         s2.axes_manager.signal_axes[0].units = "nm"
-        s3 = LumiSpectrum(np.random.random((10, 10))) * 2
-        s4 = LumiSpectrum(np.random.random((10))) * 2
+        s3 = LumiSpectrum(random_3d[0] * 2)
+        s4 = LumiSpectrum(random_3d[0, 0] * 2)
         s4.metadata.set_item("Signal.quantity", "Intensity (counts)")
         s1a = s1.normalize()
         s2a = s2.normalize()
         s3a = s3.normalize()
         s4a = s4.normalize()
-        assert s1a.max(axis=[0, 1, 2]).data[0] == 1
-        assert s2a.max(axis=[0, 1, 2, 3]).data[0] == 1
-        assert s3a.max(axis=[0, 1]).data[0] == 1
-        assert s4a.max(axis=[0]).data[0] == 1
+        assert np.max(s1a.data) == 1
+        assert np.max(s2a.data) == 1
+        assert np.max(s3a.data) == 1
+        assert np.max(s4a.data) == 1
         assert s4a.metadata.Signal.quantity == "Normalized intensity"
         assert s4a.metadata.Signal.normalized == True
         s1a = s1.normalize(element_wise=True)
         s2a = s2.normalize(element_wise=True)
         s3a = s3.normalize(element_wise=True)
         s4a = s4.normalize(element_wise=True)
-        assert np.all(s1a.max(axis=[2]).data[0] == 1)
-        assert np.all(s2a.max(axis=[3]).data[0] == 1)
-        assert np.all(s3a.max(axis=[1]).data[0] == 1)
-        assert s4a.max(axis=[0]).data[0] == 1
+        assert np.all(s1a.data.max(axis=-1) == 1)
+        # element-wise along the last signal axis, i.e. the time axis
+        assert np.all(s2a.data.max(axis=-2) == 1)
+        assert np.all(s3a.data.max(axis=-1) == 1)
+        assert np.max(s4a.data) == 1
         s1a = s1.normalize(pos=3)
         s2a = s2.normalize(pos=3, element_wise=True)
         s3a = s3.normalize(pos=3, element_wise=True)
@@ -23,36 +23,58 @@ from lumispy.signals.luminescence_spectrum import LumiSpectrum
 from hyperspy._signals.signal2d import Signal2D
 from numpy.testing import assert_allclose
 
+# expected output shared (read-only) by all background cases
+_ZEROS50 = np.zeros(50, dtype="float64")
+_ZEROS50.flags.writeable = False
+
 backgrounds = [
-    ([np.ones(50)], [np.zeros(50, dtype="float64")]),
-    (
-        [np.linspace(0, 49, num=50, dtype="float64"), np.ones(50)],
-        [np.zeros(50, dtype="float64")],
-    ),
-    (
-        [np.linspace(0, 50, num=30, dtype="float64"), np.ones(30)],
-        [np.zeros(50, dtype="float64")],
-    ),
-    (LumiSpectrum(np.ones(50)), [np.zeros(50, dtype="float64")]),
+    ([np.ones(50)], _ZEROS50),
+    ([np.linspace(0, 49, num=50, dtype="float64"), np.ones(50)], _ZEROS50),
+    ([np.linspace(0, 50, num=30, dtype="float64"), np.ones(30)], _ZEROS50),
+    (LumiSpectrum(np.ones(50)), _ZEROS50),
 ]
 
 
 class TestLumiSpectrum:
-    def test_remove_background_from_file(self):
-        for bkg, output in backgrounds:
-            s = LumiSpectrum(np.ones(50))
-            s2 = s.remove_background_from_file(bkg, inplace=False)
-            s.remove_background_from_file(bkg, inplace=True)
-            assert np.allclose(s.data, output)
-            assert np.allclose(s2.data, output)
-            assert s.metadata.Signal.background_subtracted is True
-            assert hasattr(s.metadata.Signal, "background")
+    @pytest.mark.parametrize("bkg, output", backgrounds)
+    def test_remove_background_from_file(self, bkg, output):
+        s = LumiSpectrum(np.ones(50))
+        s2 = s.remove_background_from_file(bkg, inplace=False)
+        s.remove_background_from_file(bkg, inplace=True)
+        assert np.allclose(s.data, output)
+        assert np.allclose(s2.data, output)
+        assert s.metadata.Signal.background_subtracted is True
+        assert hasattr(s.metadata.Signal, "background")
+
+    def test_remove_background_from_file_map(self):
+        s = LumiSpectrum(np.arange(150).reshape((3, 50)))
+        bkg = np.linspace(0, 49, num=50)
+        s2 = s.remove_background_from_file([bkg], inplace=False)
+        s.remove_background_from_file([bkg], inplace=True)
+        output = np.arange(150).reshape((3, 50)) - bkg
+        assert np.allclose(s.data, output)
+        assert np.allclose(s2.data, output)
+        assert np.allclose(s2.metadata.Signal.background, bkg)
+
+    def test_remove_background_from_file_dtype(self):
+        s = LumiSpectrum(np.ones(50, dtype="float32"))
+        bkg = np.linspace(0, 49, num=50)
+        s2 = s.remove_background_from_file([bkg], inplace=False)
+        assert s2.data.dtype == "float32"
+        s = LumiSpectrum(np.ones(50, dtype="uint16"))
+        s2 = s.remove_background_from_file([bkg], inplace=False)
+        assert s2.data.dtype == "float64"
 
     def test_errors_raise(self):
         s = LumiSpectrum(np.ones(50))
         with pytest.raises(AttributeError):
             bkg = np.array([[1, 1], [1, 1], [1, 1]])
             s.remove_background_from_file(bkg)
+        with pytest.raises(AttributeError, match="same length"):
+            bkg = [np.linspace(0, 49, num=50), np.ones(30)]
+            s.remove_background_from_file(bkg)
+        with pytest.raises(AttributeError, match="length of the signal axis"):
+            s.remove_background_from_file([np.ones(30)])
         # Test that a GUI is opened if s.remove_background_from_file is passed without a background
         # s.remove_background_from_file()
         # Test double background removal
@@ -85,6 +107,7 @@ class TestLumiSpectrum:
             600,
             150,
         )
+        assert not np.shares_memory(s_copy.data, s.data)
         s.px_to_nm_grating_solver(3, -20, 300, 25, 600, 150, inplace=True)
 
         assert s_copy.axes_manager.signal_axes[0].name == "Wavelength"
@@ -16,7 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with LumiSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
-from numpy import arange, ones
+import dask.array as da
+from numpy import arange, empty, ones
 from numpy.testing import assert_allclose
 from pytest import raises, mark, warns
 
@@ -83,6 +84,27 @@ def test_data2eV():
     assert_allclose(evdata[0], 12.271168e-3)
 
 
+def test_data2eV_navigation():
+    data = 100 * ones((3, 20))
+    ax0 = DataAxis(axis=arange(200, 400, 10), units="nm")
+    evaxis, factor = axis2eV(ax0)
+    evdata = data2eV(data, factor, evaxis.axis, ax0)
+    assert evdata.shape == (3, 20)
+    assert_allclose(evdata[0], data2eV(data[0], factor, evaxis.axis, ax0))
+    assert_allclose(evdata[:, 0], 12.271168)
+
+
+def test_data2eV_dtype():
+    ax0 = DataAxis(axis=arange(200, 400, 10), units="nm")
+    evaxis, factor = axis2eV(ax0)
+    data = 100 * ones(20, dtype="float32")
+    assert data2eV(data, factor, evaxis.axis, ax0).dtype == "float32"
+    assert var2eV(data, factor, evaxis.axis, ax0).dtype == "float32"
+    assert_allclose(data2eV(data, factor, evaxis.axis, ax0)[0], 12.271168)
+    data = 100 * ones(20, dtype="uint16")
+    assert data2eV(data, factor, evaxis.axis, ax0).dtype == "float64"
+
+
 def test_var2eV():
     data = 100 * ones(20)
     ax0 = DataAxis(axis=arange(200, 400, 10), units="nm")
@@ -189,6 +211,50 @@ def test_to_eV(jacobian, variance):
         assert S1.metadata.has_item("Signal.Noise_properties.variance") == False
 
 
+@mark.parametrize(("jacobian"), (True, False))
+def test_to_eV_lazy(jacobian):
+    axis = UniformDataAxis(size=20, offset=200, scale=10)
+    nav = UniformDataAxis(size=4)
+    data = ones((4, 20))
+    data[:, 0] += 1
+    S1 = LumiSpectrum(
+        data, axes=[nav.get_axis_dictionary(), axis.get_axis_dictionary()]
+    )
+    L1 = S1.as_lazy()
+    S2 = S1.to_eV(inplace=False, jacobian=jacobian)
+    L2 = L1.to_eV(inplace=False, jacobian=jacobian)
+    assert isinstance(L2.data, da.Array)
+    L1.to_eV(jacobian=jacobian)
+    assert isinstance(L1.data, da.Array)
+    assert L2.axes_manager.signal_axes[0].units == "eV"
+    assert_allclose(L1.data.compute(), S2.data)
+    assert_allclose(L2.data.compute(), S2.data)
+
+
+@mark.parametrize("jacobian", (True, False))
+def test_to_eV_out(jacobian):
+    axis = UniformDataAxis(size=20, offset=200, scale=10)
+    nav = UniformDataAxis(size=4)
+    data = ones((4, 20))
+    data[:, 0] += 1
+    S1 = LumiSpectrum(
+        data, axes=[nav.get_axis_dictionary(), axis.get_axis_dictionary()]
+    )
+    out = empty((4, 20))
+    S2 = S1.to_eV(inplace=False, jacobian=jacobian)
+    S3 = S1.to_eV(inplace=False, jacobian=jacobian, out=out)
+    assert S3.data is out
+    assert_allclose(S3.data, S2.data)
+    L1 = S1.as_lazy()
+    S1.to_invcm(jacobian=jacobian, out=out)
+    assert S1.data is out
+    with raises(ValueError, match="not supported for lazy signals"):
+        L1.to_eV(inplace=False, jacobian=jacobian, out=out)
+    with raises(ValueError, match="not supported for lazy signals"):
+        L1.to_invcm(jacobian=jacobian, out=out)
+    assert isinstance(L1.data, da.Array)
+
+
 def test_eV_slicing():
     S = LumiSpectrum(arange(100), axes=[{"axis": arange(100) + 300}])
     S.to_eV(inplace=True)
@@ -557,6 +623,14 @@ def test_to_raman_shift(jacobian):
         assert S2.data[0] == 0.008
 
 
+def test_convert_data_reverse_eV():
+    axis = UniformDataAxis(size=20, offset=200, scale=10, units="nm")
+    S1 = LumiSpectrum(ones(20), axes=(axis.get_axis_dictionary(),))
+    evaxis, factor = axis2eV(S1.axes_manager[0])
+    with raises(ValueError, match="not supported for the conversion to energy"):
+        S1._convert_data(evaxis, factor, False, True, data2eV, var2eV, reverse=False)
+
+
 def test_to_raman_shift_laser():
     axis = UniformDataAxis(size=20, offset=200, scale=10, units="nm")
     data = ones(20)
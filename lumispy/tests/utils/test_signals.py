@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
-from lumispy.utils.signals import com
+from lumispy.utils.signals import com, _com_batch
 from hyperspy.axes import FunctionalDataAxis, DataAxis, UniformDataAxis
 
 
@@ -61,3 +61,26 @@ def test_com_inputs():
         ValueError, match="The parmeter `signal_axis` must be a HyperSpy Axis object."
     ):
         com(np.ones(3), "string")
+
+
+@pytest.mark.parametrize(
+    "axis",
+    [
+        FunctionalDataAxis(
+            **{
+                "expression": "a * x**2 + b",
+                "a": 2,
+                "b": 1,
+            },
+            size=6,
+        ),
+        DataAxis(axis=[200, 250, 400, 450, 600, 700]),
+        UniformDataAxis(size=6, offset=200, scale=100),
+    ],
+)
+def test_com_batch(axis):
+    intensities = np.random.default_rng(0).random((4, 3, 6))
+    centroids = _com_batch(intensities, axis)
+    assert centroids.shape == (4, 3)
+    for i in np.ndindex(4, 3):
+        assert_allclose(centroids[i], com(intensities[i], axis))
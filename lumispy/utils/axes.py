@@ -19,7 +19,6 @@
 import numpy as np
 import scipy.constants as c
 from scipy.interpolate import interp1d
-from inspect import getfullargspec
 from copy import deepcopy
 from warnings import warn
 
@@ -96,39 +95,45 @@ def axis2eV(ax0):
     return axis, factor
 
 
-def data2eV(data, factor, evaxis, ax0):
+def _float_dtype(data):
+    """Returns the floating point type used for the Jacobian transformation of
+    `data`: floating point data keeps its precision (e.g. float32 detector
+    data is not upcast), any other data is converted to float64.
+    """
+    dtype = data.dtype if hasattr(data, "dtype") else np.asarray(data).dtype
+    if np.issubdtype(dtype, np.floating):
+        return dtype
+    return np.dtype("float64")
+
+
+def _jacobian2eV(factor, evaxis, ax0):
+    """Returns the Jacobian for the conversion to energy along the (reversed)
+    signal axis. All scalar factors are folded into this one-dimensional
+    array, so that the data only has to be multiplied once.
+    """
+    if ax0.units == "µm":
+        n_air = _n_air(1000 * ax0.axis)[::-1]
+    else:
+        n_air = _n_air(ax0.axis[::-1])
+    return factor * c.h * c.c / (c.e * n_air * evaxis**2)
+
+
+def data2eV(data, factor, evaxis, ax0, out=None):
     """The intensity is converted from counts/nm (counts/µm) to counts/meV by
     doing a Jacobian transformation, see e.g. Mooney and Kambhampati, J. Phys.
     Chem. Lett. 4, 3316 (2013). Ensures that integrated signals are still
-    correct.
+    correct. If given, the result is written to the preallocated array `out`.
     """
-    if ax0.units == "µm":
-        return (
-            data
-            * factor
-            * c.h
-            * c.c
-            / (c.e * _n_air(1000 * ax0.axis)[::-1] * evaxis**2)
-        )
-    else:
-        return data * factor * c.h * c.c / (c.e * _n_air(ax0.axis[::-1]) * evaxis**2)
+    jacobian = _jacobian2eV(factor, evaxis, ax0)
+    return np.multiply(data, jacobian.astype(_float_dtype(data), copy=False), out=out)
 
 
 def var2eV(variance, factor, evaxis, ax0):
     """The variance is converted doing a squared Jacobian renormalization to
     match with the transformation of the data.
     """
-    if ax0.units == "µm":
-        return (
-            variance
-            * (factor * c.h * c.c / (c.e * _n_air(1000 * ax0.axis)[::-1] * evaxis**2))
-            ** 2
-        )
-    else:
-        return (
-            variance
-            * (factor * c.h * c.c / (c.e * _n_air(ax0.axis[::-1]) * evaxis**2)) ** 2
-        )
+    jacobian = _jacobian2eV(factor, evaxis, ax0) ** 2
+    return variance * jacobian.astype(_float_dtype(variance), copy=False)
 
 
 def nm2invcm(x):
@@ -160,20 +165,23 @@ def axis2invcm(ax0):
     return axis, factor
 
 
-def data2invcm(data, factor, invcmaxis, ax0=None):
+def data2invcm(data, factor, invcmaxis, ax0=None, out=None):
     r"""The intensity is converted from counts/nm (counts/µm) to
     counts/cm$^{-1}$ by doing a Jacobian transformation, see e.g. Mooney and
     Kambhampati, J. Phys. Chem. Lett. 4, 3316 (2013). Ensures that integrated
-    signals are still correct.
+    signals are still correct. If given, the result is written to the
+    preallocated array `out`.
     """
-    return data * factor / (invcmaxis**2)
+    jacobian = factor / invcmaxis**2
+    return np.multiply(data, jacobian.astype(_float_dtype(data), copy=False), out=out)
 
 
 def var2invcm(variance, factor, invcmaxis, ax0=None):
     r"""The variance is converted doing a squared Jacobian renormalization to
     match with the transformation of the data.
     """
-    return variance * (factor / (invcmaxis**2)) ** 2
+    jacobian = (factor / invcmaxis**2) ** 2
+    return variance * jacobian.astype(_float_dtype(variance), copy=False)
 
 
 #
@@ -301,9 +309,7 @@ def join_spectra(S, r=50, scale=True, average=False, kind="slinear"):
         if axis.axis[ind1] >= axis2.axis[ind2]:
             ind2 += 1
             # for UniformDataAxis
-        if (not "axis" in getfullargspec(DataAxis)[0]) or (
-            axis.is_uniform and axis2.is_uniform
-        ):
+        if axis.is_uniform and axis2.is_uniform:
             # join axis vectors
             axis.size = axis.axis[: ind1 + 1].size + np.floor(
                 (axis2.axis[-1] - axis.axis[ind1]) / axis.scale
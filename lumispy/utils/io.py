@@ -141,7 +141,7 @@ def to_array(S, axes=True, transpose=False):
                 x = sig_axes[0].axis
             else:
                 x = nav_axes[0].axis
-            output = np.array([x, S.data]).T
+            output = np.column_stack((x, S.data))
         else:
             output = S.data
     # Convert linescan or matrix
@@ -156,12 +156,18 @@ def to_array(S, axes=True, transpose=False):
             else:
                 x = np.concatenate(([0], nav_axes[0].axis))
                 y = nav_axes[1].axis
+            # fill a single preallocated array instead of stacking temporaries
+            dtype = np.result_type(x.dtype, y.dtype, S.data.dtype)
             if transpose:
-                output = np.hstack(
-                    (x.reshape(x.size, 1), np.vstack((y, np.transpose(S.data))))
-                )
+                output = np.empty((x.size, y.size + 1), dtype=dtype)
+                output[:, 0] = x
+                output[0, 1:] = y
+                output[1:, 1:] = np.transpose(S.data)
             else:
-                output = np.vstack((x, np.hstack((y.reshape(y.size, 1), S.data))))
+                output = np.empty((y.size + 1, x.size), dtype=dtype)
+                output[0] = x
+                output[1:, 0] = y
+                output[1:, 1:] = S.data
         else:
             if transpose:
                 output = np.transpose(S.data)
@@ -1,4 +1,5 @@
 import numpy as np
+import dask.array as da
 from hyperspy.axes import FunctionalDataAxis
 from scipy.ndimage import center_of_mass
 from scipy.interpolate import interp1d
@@ -79,3 +80,46 @@ def com(spectrum_intensities, signal_axis, **kwargs):
         raise ValueError("The parmeter `signal_axis` must be a HyperSpy Axis object.")
 
     return com_val
+
+
+def _com_batch(data, signal_axis):
+    """Finds the centroids (center of mass) of all spectra in `data` at once,
+    equivalent to applying `com` to every spectrum along the last axis of the
+    array. The center of mass is computed with respect to the array index and
+    linearly interpolated on the signal axis.
+
+    Parameters
+    ----------
+    data : numpy.ndarray or dask.array.Array
+        An array with the spectra along the last axis.
+    signal_axis: hyperspy.axes.BaseDataAxis subclass
+        The HyperSpy signal axis of the spectra.
+
+    Returns
+    -------
+    center_of_mass : numpy.ndarray or dask.array.Array
+        The centroids with the shape of the navigation dimensions of `data`.
+    """
+    # Find center of mass wrt array index
+    index = np.arange(data.shape[-1])
+    index_com = (data * index).sum(axis=-1) / data.sum(axis=-1)
+
+    if type(signal_axis) == FunctionalDataAxis:
+        axis_array = signal_axis.x.axis
+    else:
+        axis_array = signal_axis.axis
+
+    # Linear interpolation between the neighbouring axis values
+    if isinstance(index_com, da.Array):
+        com_val = index_com.map_blocks(np.interp, index, axis_array, dtype=float)
+    else:
+        com_val = np.interp(index_com, index, axis_array)
+
+    if type(signal_axis) == FunctionalDataAxis:
+        # Calculate value y from x[index_com]
+        kwargs = {}
+        for kwarg in signal_axis.parameters_list:
+            kwargs[kwarg] = getattr(signal_axis, kwarg)
+        com_val = signal_axis._function(com_val, **kwargs)
+
+    return com_val